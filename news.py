@@ -1,14 +1,27 @@
 import os
 import sys
-import json
+import calendar
+import io
+import hashlib
 import logging
 import random
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 import time
 
 import requests
 import feedparser
-from bs4 import BeautifulSoup
+import orjson
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from diskcache import Cache
 from dotenv import load_dotenv
 
 # --- Configuration & Constants ---
@@ -23,6 +36,9 @@ ELEVENLABS_API_KEY: str = os.getenv("ELEVENLABS_API_KEY", "")
 ELEVENLABS_VOICE_ID: str = os.getenv("ELEVENLABS_VOICE_ID", "")  # IMPORTANT: Set this in .env
 DEFAULT_RSS_URL: str = os.getenv("DEFAULT_RSS_URL", "")
 
+# Concurrency
+MAX_CONCURRENT_FETCHES: int = int(os.getenv("MAX_CONCURRENT_FETCHES", min(8, (os.cpu_count() or 1) * 2)))
+
 # API URLs
 TELEGRAM_API_BASE_URL = f"https://api.telegram.org/bot{BOT_TOKEN}"
 TELEGRAM_SEND_MESSAGE_URL = f"{TELEGRAM_API_BASE_URL}/sendMessage"
@@ -35,6 +51,42 @@ LOG_DIR = "/home/python/logs"
 LOG_FILE_NAME = f"news.{datetime.now().strftime('%d-%b-%Y')}.log"
 LOG_FILE_PATH = os.path.join(LOG_DIR, LOG_FILE_NAME)
 
+# Article content containers in order of preference, matched in a single pass over the DOM
+CONTENT_SELECTOR = "section#entry-body, main, article, body"
+CONTENT_PRIORITY = {"section": 0, "main": 1, "article": 2, "body": 3}
+# Elements that start a new paragraph (line) in the extracted text; inline markup is joined in place
+BLOCK_TAGS = frozenset({
+    "p", "li", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "div", "section", "article",
+    "main", "header", "footer", "aside", "figure", "figcaption", "ul", "ol", "dl", "dt", "dd",
+    "table", "tr", "td", "th", "body",
+})
+# Elements whose contents are code or markup rather than readable text
+NON_TEXT_TAGS = ["script", "style", "noscript", "template"]
+
+# Article downloads are truncated beyond this size
+ARTICLE_MAX_BYTES = 2_000_000
+
+# Text-to-speech: the narrative is synthesised in sentence-aligned chunks, several at a time
+TTS_CHUNK_MAX_CHARS = 500
+TTS_MAX_CONCURRENCY = 4  # Stay within ElevenLabs' concurrent request limit
+
+# Per-host rate limiting: (max concurrent requests, min seconds between request starts)
+DEFAULT_HOST_RATE_LIMIT = (2, 0.5)  # Be polite to article publishers
+HOST_RATE_LIMITS = {
+    urlparse(TELEGRAM_API_BASE_URL).netloc: (1, 1.0),  # Telegram allows ~1 message per second per chat
+    urlparse(DS_API_URL).netloc: (1, 0.0),
+    urlparse(ELEVENLABS_API_URL).netloc: (TTS_MAX_CONCURRENCY, 0.0),
+}
+
+# Cache
+CACHE_DIR = "/home/python/cache"
+ARTICLE_CACHE_TTL = 48 * 60 * 60  # Seconds; articles reappear in the 24h window of later runs
+NARRATIVE_CACHE_TTL = 24 * 60 * 60  # Seconds
+FEED_CACHE_TTL = 48 * 60 * 60  # Seconds; only needed until the feed's validators change
+
+# Paragraph deduplication: only repeated paragraphs at least this long are dropped
+DEDUP_MIN_LENGTH = 80
+
 # User Agents for requests
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -59,6 +111,48 @@ If no text is provided, state that no news could be processed.
 """
 
 
+# HTTP session shared by all requests so connections are pooled and kept alive
+HTTP_POOL_SIZE = 20
+# (connect, read) seconds. With one read retry a stalled host costs a worker ~30s at most.
+DEFAULT_TIMEOUT = (5, 12)
+MAX_RETRY_AFTER = 5  # Seconds; longer server Retry-After values are clamped
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After but never sleeps longer than MAX_RETRY_AFTER.
+
+    The wait happens inside host_rate_limit, so an uncapped Retry-After (e.g. 3600 on a 429)
+    would hold the host's slots and stall every worker fetching from that host.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+SESSION = requests.Session()
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=CappedRetry(total=3, connect=2, read=1, backoff_factor=0.5,
+                            status_forcelist=[429, 500, 502, 503, 504], respect_retry_after_header=True),
+)
+SESSION.mount("https://", HTTP_ADAPTER)
+SESSION.mount("http://", HTTP_ADAPTER)
+# One user agent per run: pooled keep-alive connections keep presenting the same browser
+SESSION.headers["User-Agent"] = random.choice(USER_AGENTS)
+
+# Per-host rate limiter state
+_host_semaphores = {}
+_host_next_request_time = defaultdict(float)
+_host_lock = threading.Lock()
+
+# Disk cache for extracted article text and LLM narratives, shared across runs
+CACHE = Cache(CACHE_DIR)
+
+
 # --- Logging Setup ---
 def setup_logging():
     """Sets up the logging configuration."""
@@ -75,99 +169,200 @@ def setup_logging():
 
 
 # --- Helper Functions ---
-def get_random_user_agent():
-    """Returns a random user agent string."""
-    return random.choice(USER_AGENTS)
+@contextmanager
+def host_rate_limit(url: str):
+    """Limits concurrency and spaces out request starts per host (see HOST_RATE_LIMITS)."""
+    host = urlparse(url).netloc
+    max_concurrency, min_interval = HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE_LIMIT)
+    with _host_lock:
+        semaphore = _host_semaphores.setdefault(host, threading.Semaphore(max_concurrency))
+    with semaphore:
+        # Reserve the next free slot for this host, then wait for it outside the lock
+        with _host_lock:
+            now = time.monotonic()
+            start = max(now, _host_next_request_time[host])
+            _host_next_request_time[host] = start + min_interval
+        if start > now:
+            time.sleep(start - now)
+        yield
 
 
 def make_request(url, method="GET", **kwargs):
-    """Makes an HTTP request with a random user agent and error handling."""
-    headers = kwargs.pop("headers", {})
-    if "User-Agent" not in headers:
-        headers["User-Agent"] = get_random_user_agent()
+    """Makes an HTTP request through the shared session (user agent, pooling, retries) with error handling."""
+    headers = kwargs.pop("headers", None)
+    timeout = kwargs.pop("timeout", DEFAULT_TIMEOUT)
 
     try:
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers, timeout=120, **kwargs)
-        elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, timeout=120, **kwargs)
-        else:
-            logging.error(f"Unsupported HTTP method: {method}")
+        if method.upper() not in ("GET", "POST"):
+            logging.error("Unsupported HTTP method: %s", method)
             return None
+        with host_rate_limit(url):
+            response = SESSION.request(method.upper(), url, headers=headers, timeout=timeout, **kwargs)
         response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
         return response
     except requests.exceptions.RequestException as e:
-        logging.error(f"Request failed for {url}. Error: {e}")
+        logging.error("Request failed for %s. Error: %s", url, e)
         return None
 
 
 def fetch_rss_entries(rss_url: str):
     """Fetches and parses RSS feed, returns entries from the last 24 hours."""
-    logging.info(f"Fetching RSS feed from: {rss_url}")
-    feed_data = feedparser.parse(rss_url, agent=get_random_user_agent())
-
-    if feed_data.bozo:
-        logging.warning(f"RSS feed may be malformed. Bozo reason: {feed_data.bozo_exception}")
+    logging.info("Fetching RSS feed from: %s", rss_url)
+    # Conditional GET: if the feed hasn't changed since the last run, reuse its parsed entries
+    cached_feed = CACHE.get(("feed", rss_url))
+    headers = {}
+    if cached_feed:
+        if cached_feed["etag"]:
+            headers["If-None-Match"] = cached_feed["etag"]
+        if cached_feed["last_modified"]:
+            headers["If-Modified-Since"] = cached_feed["last_modified"]
+
+    response = make_request(rss_url, headers=headers)
+    if not response:
+        logging.error("Failed to fetch RSS feed.")
+        return []
 
-    if not feed_data.entries:
+    if response.status_code == 304 and cached_feed:
+        logging.info("RSS feed not modified since last run. Reusing cached entries.")
+        entries = cached_feed["entries"]
+    else:
+        # Wrapped in BytesIO so feedparser never treats the content as a URL or path
+        feed_data = feedparser.parse(io.BytesIO(response.content), response_headers={
+            "content-type": response.headers.get("Content-Type", ""),
+            "content-location": response.url,
+        })
+
+        if feed_data.bozo:
+            logging.warning("RSS feed may be malformed. Bozo reason: %s", feed_data.bozo_exception)
+
+        entries = feed_data.entries
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if entries and (etag or last_modified):
+            CACHE.set(("feed", rss_url), {"etag": etag, "last_modified": last_modified, "entries": entries},
+                      expire=FEED_CACHE_TTL)
+
+    if not entries:
         logging.info("No entries found in the RSS feed.")
         return []
 
     recent_entries = []
     now = datetime.now(timezone.utc)  # Use timezone-aware datetime
-    twenty_four_hours_ago = now - timedelta(days=1)
+    cutoff_epoch = int((now - timedelta(days=1)).timestamp())
 
-    for entry in feed_data.entries:
+    for entry in entries:
+        title = entry.get('title', 'No Title')
         published_time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
         if published_time_struct:
-            # Convert struct_time to timezone-aware datetime object (assuming feed times are UTC)
-            entry_date = datetime.fromtimestamp(time.mktime(published_time_struct), timezone.utc)
-            if entry_date >= twenty_four_hours_ago:
+            # feedparser normalises dates to UTC, so convert with timegm (mktime would assume local time)
+            if calendar.timegm(published_time_struct) >= cutoff_epoch:
                 recent_entries.append(entry)
-                logging.info(f"Found recent entry: '{entry.get('title', 'No Title')}' published at {entry_date}")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    entry_date = time.strftime("%Y-%m-%d %H:%M:%S UTC", published_time_struct)
+                    logging.info("Found recent entry: '%s' published at %s", title, entry_date)
             # else:
-            #     logging.debug(f"Skipping old entry: '{entry.get('title', 'No Title')}' published at {entry_date}")
+            #     logging.debug("Skipping old entry: '%s'", title)
         else:
-            logging.warning(f"Entry '{entry.get('title', 'No Title')}' has no parsable date. Skipping.")
+            logging.warning("Entry '%s' has no parsable date. Skipping.", title)
 
-    logging.info(f"Found {len(recent_entries)} recent entries from the last 24 hours.")
+    logging.info("Found %s recent entries from the last 24 hours.", len(recent_entries))
     return recent_entries
 
 
-def extract_text_from_url(article_url: str) -> str | None:
-    """Extracts text content from <section id="entry-body"> of a given URL."""
-    logging.info(f"Extracting text from: {article_url}")
-    response = make_request(article_url)
+def fetch_article_html(article_url: str) -> bytes | None:
+    """Downloads the raw HTML of an article page."""
+    logging.info("Fetching article: %s", article_url)
+    response = make_request(article_url, stream=True)
     if not response:
         return None
 
+    # Read in chunks and stop at a hard cap, so one oversized page can't exhaust memory
+    html = bytearray()
+    try:
+        with response:
+            for chunk in response.iter_content(chunk_size=65536):
+                html.extend(chunk)
+                if len(html) > ARTICLE_MAX_BYTES:
+                    logging.warning("Article %s exceeds %s bytes. Truncating.", article_url, ARTICLE_MAX_BYTES)
+                    del html[ARTICLE_MAX_BYTES:]
+                    break
+    except requests.exceptions.RequestException as e:
+        logging.error("Failed to read article body from %s. Error: %s", article_url, e)
+        return None
+    return bytes(html)
+
+
+def block_text(root) -> str:
+    """Returns the text under root with one line per block element.
+
+    Text nodes inside the same block (e.g. around <a> or <b>) are joined as written, so a
+    line is a whole paragraph rather than a fragment of one.
+    """
+    lines = []
+    fragments = []
+    current_block = None
+
+    def flush():
+        line = " ".join("".join(fragments).split())
+        if line:
+            lines.append(line)
+        fragments.clear()
+
+    for node in root.traverse(include_text=True):
+        if node.tag == "-text":
+            block = node.parent
+            while block.mem_id != root.mem_id and block.tag not in BLOCK_TAGS:
+                block = block.parent
+            if block.mem_id != current_block:
+                flush()
+                current_block = block.mem_id
+            fragments.append(node.text_content or "")
+        elif node.tag == "br":
+            flush()
+            current_block = None
+    flush()
+    return "\n".join(lines)
+
+
+def extract_text_from_html(html: bytes, article_url: str) -> str | None:
+    """Extracts text content from <section id="entry-body"> of an article's HTML."""
     try:
-        soup = BeautifulSoup(response.content, "html.parser")
-        entry_body = soup.find("section", id="entry-body")
-        if entry_body:
-            text = entry_body.get_text(separator="\n", strip=True)
-            logging.info(f"Successfully extracted text from {article_url} (length: {len(text)})")
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(NON_TEXT_TAGS)  # Node.text() would otherwise include inline JS/CSS
+        content = min(tree.css(CONTENT_SELECTOR), key=lambda node: CONTENT_PRIORITY[node.tag], default=None)
+        if content and content.tag == "section":
+            text = block_text(content)
+            logging.info("Successfully extracted text from %s (length: %s)", article_url, len(text))
             return text
         else:
-            logging.warning(f"Could not find <section id='entry-body'> in {article_url}")
-            # Fallback: try to get some main content if specific tag is not found
-            main_content = soup.find("main") or soup.find("article") or soup.find("body")
-            if main_content:
-                text = main_content.get_text(separator="\n", strip=True)
+            logging.warning("Could not find <section id='entry-body'> in %s", article_url)
+            # Fallback: use the best main/article/body match if specific tag is not found
+            if content:
+                text = block_text(content)
                 # Limit fallback text size to avoid noise
                 if len(text) > 200:  # only return if substantial text found
-                    logging.info(
-                        f"Fallback: Extracted text from {main_content.name} in {article_url} (length: {len(text)})")
+                    logging.info("Fallback: Extracted text from %s in %s (length: %s)",
+                                 content.tag, article_url, len(text))
                     return text
-            logging.warning(f"No suitable content found in {article_url} using fallback.")
+            logging.warning("No suitable content found in %s using fallback.", article_url)
             return None
     except Exception as e:
-        logging.error(f"Error parsing HTML from {article_url}: {e}")
+        logging.error("Error parsing HTML from %s: %s", article_url, e)
         return None
 
 
-def get_llm_narrative(text_corpus: str) -> str | None:
-    """Sends text to DeepSeek LLM and returns the generated narrative."""
+def article_set_key(entries) -> str:
+    """Returns a stable hash identifying a set of articles by their titles and links."""
+    parts = [entry.get("title", "") for entry in entries] + [entry.get("link", "") for entry in entries]
+    return hashlib.blake2b("||".join(sorted(parts)).encode()).hexdigest()
+
+
+def get_llm_narrative(text_corpus: str, cache_key: str | None = None) -> str | None:
+    """Sends text to DeepSeek LLM and returns the generated narrative.
+
+    Narratives are cached under ``cache_key`` (see ``article_set_key``), or under a hash of
+    the corpus itself when no key is given.
+    """
     if not DS_API_KEY:
         logging.error("DeepSeek API key not configured.")
         return None
@@ -175,8 +370,16 @@ def get_llm_narrative(text_corpus: str) -> str | None:
         logging.info("Text corpus is empty. LLM will be prompted accordingly.")
         # Allow LLM to respond to empty input, e.g., "No articles found"
 
+    if cache_key is None:
+        cache_key = hashlib.blake2b(text_corpus.encode()).hexdigest()
+    cache_key = ("narrative", cache_key)
+    cached_narrative = CACHE.get(cache_key)
+    if cached_narrative is not None:
+        logging.info("Using cached narrative for the same set of articles (length: %s)", len(cached_narrative))
+        return cached_narrative
+
     logging.info("Sending text to DeepSeek for narrative generation...")
-    payload = json.dumps({
+    payload = orjson.dumps({
         "messages": [
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": text_corpus or "No articles were found or text could not be extracted."}
@@ -194,39 +397,51 @@ def get_llm_narrative(text_corpus: str) -> str | None:
         "Content-Type": "application/json",
         "Authorization": f"Bearer {DS_API_KEY}"
     }
-    response = make_request(DS_API_URL, method="POST", data=payload, headers=headers)
+    # Generating up to 2048 tokens can take well over the default read timeout
+    response = make_request(DS_API_URL, method="POST", data=payload, headers=headers, timeout=(5, 120))
     if not response:
         logging.error("Failed to get response from DeepSeek API.")
         return None
 
     try:
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         if "choices" in response_data and response_data["choices"]:
             narrative = response_data["choices"][0]["message"]["content"]
-            logging.info(f"Narrative received from DeepSeek (length: {len(narrative)})")
+            logging.info("Narrative received from DeepSeek (length: %s)", len(narrative))
+            CACHE.set(cache_key, narrative, expire=NARRATIVE_CACHE_TTL)
             return narrative
         else:
-            logging.error(f"DeepSeek API response error or empty: {response_data}")
+            logging.error("DeepSeek API response error or empty: %s", response_data)
             return None
-    except json.JSONDecodeError as e:
-        logging.error(f"Failed to decode JSON response from DeepSeek: {e}")
-        logging.error(f"DeepSeek raw response: {response.text}")
+    except orjson.JSONDecodeError as e:
+        logging.error("Failed to decode JSON response from DeepSeek: %s", e)
+        logging.error("DeepSeek raw response: %s", response.text)
         return None
     except Exception as e:
-        logging.error(f"An unexpected error occurred with DeepSeek response processing: {e}")
+        logging.error("An unexpected error occurred with DeepSeek response processing: %s", e)
         return None
 
 
-def text_to_speech_elevenlabs(text: str) -> bytes | None:
-    """Converts text to speech using ElevenLabs and returns MP3 audio bytes."""
-    if not ELEVENLABS_API_KEY or not ELEVENLABS_VOICE_ID:
-        logging.error("ElevenLabs API key or Voice ID not configured.")
-        return None
-    if not text.strip():
-        logging.warning("Empty text provided for text-to-speech.")
-        return None
+def split_into_chunks(text: str, max_len: int) -> list[str]:
+    """Groups sentences into chunks of at most max_len characters (longer sentences stand alone)."""
+    chunks = []
+    current = ""
+    for sentence in re.split(r"(?<=[.!?])\s+", text.strip()):
+        if current and len(current) + 1 + len(sentence) > max_len:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
 
-    logging.info("Sending text to ElevenLabs for speech synthesis...")
+def synthesize_speech_chunk(text: str, previous_text: str = "", next_text: str = "") -> bytes | None:
+    """Converts one chunk of text to speech using ElevenLabs and returns MP3 audio bytes.
+
+    The neighbouring chunks are passed as context so intonation carries across chunk boundaries.
+    """
     payload = {
         "text": text,
         "model_id": "eleven_multilingual_v2",  # Or another model if preferred
@@ -235,7 +450,9 @@ def text_to_speech_elevenlabs(text: str) -> bytes | None:
             "similarity_boost": 0.75,
             # "style": 0.45, # example, if model supports
             # "use_speaker_boost": True # example, if model supports
-        }
+        },
+        "previous_text": previous_text,
+        "next_text": next_text,
     }
     headers = {
         "Accept": "audio/mpeg",
@@ -243,17 +460,44 @@ def text_to_speech_elevenlabs(text: str) -> bytes | None:
         "xi-api-key": ELEVENLABS_API_KEY
     }
 
-    response = make_request(ELEVENLABS_API_URL, method="POST", json=payload, headers=headers)
+    response = make_request(ELEVENLABS_API_URL, method="POST", data=orjson.dumps(payload), headers=headers,
+                            timeout=(5, 60))
     if not response:
         logging.error("Failed to get response from ElevenLabs API.")
         return None
 
     if response.status_code == 200 and response.content:
-        logging.info("MP3 audio received from ElevenLabs.")
         return response.content
     else:
-        logging.error(f"ElevenLabs API error. Status: {response.status_code}, Response: {response.text}")
+        logging.error("ElevenLabs API error. Status: %s, Response: %s", response.status_code, response.text)
+        return None
+
+
+def text_to_speech_elevenlabs(text: str) -> bytes | None:
+    """Converts text to speech using ElevenLabs and returns MP3 audio bytes.
+
+    The text is split on sentence boundaries and the chunks are synthesised concurrently; the
+    resulting MP3 streams are concatenated, which is valid because each ends on a frame boundary.
+    """
+    if not ELEVENLABS_API_KEY or not ELEVENLABS_VOICE_ID:
+        logging.error("ElevenLabs API key or Voice ID not configured.")
+        return None
+    if not text.strip():
+        logging.warning("Empty text provided for text-to-speech.")
+        return None
+
+    chunks = split_into_chunks(text, TTS_CHUNK_MAX_CHARS)
+    logging.info("Sending text to ElevenLabs for speech synthesis in %s chunk(s)...", len(chunks))
+    previous_texts = [""] + chunks[:-1]
+    next_texts = chunks[1:] + [""]
+    with ThreadPoolExecutor(max_workers=TTS_MAX_CONCURRENCY) as executor:
+        audio_chunks = list(executor.map(synthesize_speech_chunk, chunks, previous_texts, next_texts))
+
+    if not all(audio_chunks):
+        logging.error("Speech synthesis failed for at least one chunk.")
         return None
+    logging.info("MP3 audio received from ElevenLabs.")
+    return b"".join(audio_chunks)
 
 
 def send_telegram_message(text_message: str):
@@ -264,38 +508,165 @@ def send_telegram_message(text_message: str):
     logging.info("Sending text message to Telegram...")
     payload = {"chat_id": CHAT_ID, "text": text_message, "parse_mode": "Markdown"}
     response = make_request(TELEGRAM_SEND_MESSAGE_URL, method="POST", data=payload)
-    if response and response.json().get("ok"):
+    if response and orjson.loads(response.content).get("ok"):
         logging.info("Text message sent successfully to Telegram.")
         return True
     else:
-        logging.error(
-            f"Failed to send text message to Telegram. Response: {response.text if response else 'No response'}")
+        logging.error("Failed to send text message to Telegram. Response: %s",
+                      response.text if response else 'No response')
         return False
 
 
+def split_message(text: str, max_len: int) -> list[str]:
+    """Splits text into parts of at most max_len characters, breaking on line boundaries."""
+    parts = []
+    current = ""
+    for line in text.split("\n"):
+        while len(line) > max_len:  # A single line longer than a part is hard-split
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(line[:max_len])
+            line = line[max_len:]
+        if current and len(current) + 1 + len(line) > max_len:
+            parts.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        parts.append(current)
+    return parts
+
+
+def send_telegram_messages(text: str, max_len: int = 4000):
+    """Sends text via Telegram bot, split into numbered parts if too long for one message."""
+    if len(text) <= max_len:
+        return send_telegram_message(text)
+    # Parts go out in order, one at a time: Telegram allows about one message per second per chat
+    # and concurrent sends could arrive out of order. host_rate_limit spaces out the request starts,
+    # so each send's round trip overlaps the wait for the next slot.
+    results = [send_telegram_message(f"[Part {number}]\n{part}")
+               for number, part in enumerate(split_message(text, max_len), start=1)]
+    return all(results)
+
+
 def send_telegram_audio(audio_bytes: bytes, caption: str):
     """Sends an MP3 audio file via Telegram bot."""
     if not BOT_TOKEN or not CHAT_ID:
         logging.error("Telegram Bot Token or Chat ID not configured.")
         return False
     logging.info("Sending audio to Telegram...")
-    files = {"audio": ("daily_news_summary.mp3", audio_bytes, "audio/mpeg")}
-    data = {"chat_id": CHAT_ID, "caption": caption[:1024]}  # Caption limit for audio
+    encoder = MultipartEncoder(fields={
+        "chat_id": CHAT_ID,
+        "caption": caption[:1024],  # Caption limit for audio
+        "audio": ("daily_news_summary.mp3", io.BytesIO(audio_bytes), "audio/mpeg"),
+    })
 
-    # Note: requests library handles multipart/form-data encoding for files
+    # Note: MultipartEncoder streams the form body to the socket as it is read, rather than
+    # building a second in-memory copy of the audio the way requests' files= does
     # We don't use the json_payload or common_headers from make_request for file uploads
     try:
-        response = requests.post(TELEGRAM_SEND_AUDIO_URL, files=files, data=data, timeout=60)
+        with host_rate_limit(TELEGRAM_SEND_AUDIO_URL):
+            response = SESSION.post(TELEGRAM_SEND_AUDIO_URL, data=encoder,
+                                    headers={"Content-Type": encoder.content_type}, timeout=(5, 60))
         response.raise_for_status()
-        if response.json().get("ok"):
+        if orjson.loads(response.content).get("ok"):
             logging.info("Audio sent successfully to Telegram.")
             return True
         else:
-            logging.error(f"Failed to send audio to Telegram. Response: {response.text}")
+            logging.error("Failed to send audio to Telegram. Response: %s", response.text)
             return False
     except requests.exceptions.RequestException as e:
-        logging.error(f"Telegram audio send request failed: {e}")
+        logging.error("Telegram audio send request failed: %s", e)
         return False
+    except orjson.JSONDecodeError as e:
+        logging.error("Failed to decode Telegram audio send response: %s", e)
+        return False
+
+
+def fetch_article_texts(entries) -> list[tuple[dict, str]]:
+    """Extracts text from the entries' links, returning (entry, text) pairs in feed order.
+
+    Downloads run concurrently in a thread pool; HTML parsing is CPU-bound and is done
+    afterwards in the calling thread so it doesn't contend with the downloads for the GIL.
+    """
+    texts = [None] * len(entries)
+    pages = [None] * len(entries)
+    # More workers than pooled connections per host would just open and discard extra connections
+    max_workers = min(MAX_CONCURRENT_FETCHES, HTTP_POOL_SIZE)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for index, entry in enumerate(entries):
+            link = entry.get("link")
+            if not link:
+                logging.warning("Entry '%s' has no link. Skipping.", entry.get('title', 'No Title'))
+                continue
+            cached_text = CACHE.get(("article_text", link))
+            if cached_text is not None:
+                logging.info("Using cached text for %s (length: %s)", link, len(cached_text))
+                texts[index] = cached_text
+            else:
+                futures[executor.submit(fetch_article_html, link)] = index
+
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    pages[index] = future.result()
+                except Exception as e:
+                    logging.error("Unexpected error fetching %s: %s", entries[index].get('link'), e)
+        except BaseException:
+            # e.g. Ctrl+C: drop the queued downloads instead of waiting for all of them to run
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    for index, html in enumerate(pages):
+        if not html:
+            continue
+        link = entries[index]["link"]
+        texts[index] = extract_text_from_html(html, link)
+        if texts[index]:
+            CACHE.set(("article_text", link), texts[index], expire=ARTICLE_CACHE_TTL)
+
+    return [(entry, text) for entry, text in zip(entries, texts) if text]
+
+
+def dedupe_paragraphs(articles: list[tuple[dict, str]]) -> list[tuple[dict, str]]:
+    """Removes paragraphs that already appeared earlier in the corpus.
+
+    Syndicated stories, shared quotes and site boilerplate otherwise get sent to the LLM
+    several times. Only paragraphs of at least DEDUP_MIN_LENGTH characters are dropped, and a
+    dropped run is replaced by a reference to the article it first appeared in, so the
+    remaining text stays coherent.
+    """
+    seen = {}
+    deduped = []
+    removed_chars = 0
+    for index, (entry, text) in enumerate(articles):
+        kept = []
+        skipped_from = None
+        for paragraph in text.split("\n"):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if len(paragraph) < DEDUP_MIN_LENGTH:  # Short lines are too generic to count as duplicates
+                kept.append(paragraph)
+                continue
+            digest = hashlib.blake2b(paragraph.encode(), digest_size=8).digest()
+            first_seen_in = seen.setdefault(digest, index)
+            if first_seen_in == index:
+                kept.append(paragraph)
+                skipped_from = None
+                continue
+            removed_chars += len(paragraph)
+            if skipped_from != first_seen_in:
+                kept.append(f"[see Article: {articles[first_seen_in][0].get('title', 'Untitled Article')}]")
+                skipped_from = first_seen_in
+        if kept:
+            deduped.append((entry, "\n".join(kept)))
+
+    logging.info("Removed %s characters of duplicate paragraphs from the corpus.", removed_chars)
+    return deduped
 
 
 # --- Main Execution ---
@@ -314,26 +685,32 @@ def main(rss_url: str):
         send_telegram_message("No new articles found in the RSS feed in the last 24 hours.")
         return
 
-    all_extracted_text = []
-    for entry in recent_entries:
-        link = entry.get("link")
-        if link:
-            text = extract_text_from_url(link)
-            if text:
-                title = entry.get('title', 'Untitled Article')
-                all_extracted_text.append(f"--- Article: {title} ---\n{text}\n\n")
-        else:
-            logging.warning(f"Entry '{entry.get('title', 'No Title')}' has no link. Skipping.")
+    articles = fetch_article_texts(recent_entries)
 
-    if not all_extracted_text:
+    if not articles:
         logging.info("No text could be extracted from recent articles.")
         send_telegram_message("Found recent articles, but could not extract text content.")
         return
 
-    full_text_corpus = "".join(all_extracted_text)
-    logging.info(f"Total length of extracted text corpus: {len(full_text_corpus)}")
+    articles = dedupe_paragraphs(articles)
+    corpus = io.StringIO()
+    for entry, text in articles:
+        corpus.write("--- Article: ")
+        corpus.write(entry.get('title', 'Untitled Article'))
+        corpus.write(" ---\n")
+        corpus.write(text)
+        corpus.write("\n\n")
+    full_text_corpus = corpus.getvalue()
+    logging.info("Total length of extracted text corpus: %s", len(full_text_corpus))
+
+    # The same set of articles was already summarised and delivered by a previous run: skip the paid
+    # API calls. Keyed like the narrative cache, so a feed that merely reorders entries still matches.
+    articles_key = article_set_key([entry for entry, _ in articles])
+    if CACHE.get("last_delivered_articles") == articles_key:
+        logging.info("Articles unchanged since the last delivered summary. Nothing to send.")
+        return
 
-    narrative = get_llm_narrative(full_text_corpus)
+    narrative = get_llm_narrative(full_text_corpus, cache_key=articles_key)
     if not narrative:
         logging.error("Failed to generate narrative from LLM. Sending raw text (if short) or error.")
         # Truncate if too long for a Telegram message
@@ -349,10 +726,11 @@ def main(rss_url: str):
 
     audio_data = text_to_speech_elevenlabs(narrative)
     audio_sent = False
+    delivered = False
     if audio_data:
         if send_telegram_audio(audio_data, caption=f"Your 24hr News Summary:\n{audio_caption_summary}"):
             logging.info("Audio summary sent to Telegram.")
-            audio_sent = True
+            audio_sent = delivered = True
         else:
             logging.warning("Failed to send audio summary to Telegram. Will attempt to send text version.")
     else:
@@ -361,16 +739,13 @@ def main(rss_url: str):
     if not audio_sent:
         logging.info("Sending text narrative to Telegram as fallback.")
         # Send the full narrative as text if audio failed
-        # Split into multiple messages if too long for Telegram (4096 char limit)
-        max_len = 4000  # Leave some buffer
-        if len(narrative) > max_len:
-            for i in range(0, len(narrative), max_len):
-                chunk = narrative[i:i + max_len]
-                send_telegram_message(f"[Part {i // max_len + 1}]\n{chunk}")
-                time.sleep(1)  # Avoid rate limiting
-        else:
-            send_telegram_message(narrative)
-        logging.info("Text narrative sent to Telegram.")
+        # Split into multiple messages if too long for Telegram (4096 char limit, 4000 leaves some buffer)
+        if send_telegram_messages(narrative, max_len=4000):
+            logging.info("Text narrative sent to Telegram.")
+            delivered = True
+
+    if delivered:
+        CACHE.set("last_delivered_articles", articles_key)
 
     logging.info("News aggregation process finished.")
 
@@ -380,10 +755,10 @@ if __name__ == "__main__":
 
     if len(sys.argv) > 1:
         rss_feed_url = sys.argv[1]
-        logging.info(f"Using RSS feed URL from command line: {rss_feed_url}")
+        logging.info("Using RSS feed URL from command line: %s", rss_feed_url)
     elif DEFAULT_RSS_URL:
         rss_feed_url = DEFAULT_RSS_URL
-        logging.info(f"Using default RSS feed URL from .env: {rss_feed_url}")
+        logging.info("Using default RSS feed URL from .env: %s", rss_feed_url)
     else:
         logging.error("No RSS feed URL provided. Please pass as a command line argument or set DEFAULT_RSS_URL in .env")
         print("Usage: python news.py <RSS_FEED_URL>", file=sys.stderr)
@@ -396,9 +771,9 @@ if __name__ == "__main__":
     try:
         main(rss_feed_url)
     except Exception as e:
-        logging.critical(f"An unhandled exception occurred in main: {e}", exc_info=True)
+        logging.critical("An unhandled exception occurred in main: %s", e, exc_info=True)
         # Try to send a Telegram notification about the critical failure
         try:
             send_telegram_message(f"CRITICAL ERROR in news bot: {e}. Check logs.")
         except Exception as te:
-            logging.error(f"Failed to send critical error notification to Telegram: {te}")
\ No newline at end of file
+            logging.error("Failed to send critical error notification to Telegram: %s", te)
\ No newline at end of file